@@ -11,7 +11,28 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 import warnings
-warnings.filterwarnings('ignore')
+
+# Use orjson's C serializer for exports when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_default(obj):
+    """
+    Convert values the json module cannot serialize, matching orjson's output.
+
+    Parameters:
+    obj (object): Value to convert
+
+    Returns:
+    object: Native Python value for NumPy types, otherwise the string form
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
 
 class MedicalInsuranceAnalyzer:
     """
@@ -30,6 +51,12 @@ class MedicalInsuranceAnalyzer:
         self.df_labeled = df_labeled if df_labeled is not None else df_clean
         self.analysis_results = {}
 
+        # Which label columns are available, checked once up front
+        self._has_labels = {
+            col: col in self.df_labeled.columns
+            for col in ('smoker_label', 'sex_label', 'region_label')
+        }
+
     def basic_statistics(self):
         """
         Calculate basic descriptive statistics.
@@ -40,13 +67,36 @@ class MedicalInsuranceAnalyzer:
         print("📊 Calculating basic statistics...")
 
         desc_stats = self.df_clean.describe()
+
+        # Select the numeric columns once and derive the spread and shape statistics
+        # from the central moments, with the same sample corrections pandas applies
+        num = self.df_clean.select_dtypes(include=[np.number])
+        x = num.to_numpy(dtype=np.float64)
+        n = len(x)
+        d = x - x.mean(axis=0)
+        d2 = d * d
+        m2 = d2.mean(axis=0)
+        m3 = (d2 * d).mean(axis=0)
+        m4 = (d2 * d2).mean(axis=0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            variance = m2 * n / (n - 1)
+            skewness = m3 / m2 ** 1.5 * np.sqrt(n * (n - 1)) / (n - 2)
+            kurtosis = ((n + 1) * (m4 / m2 ** 2 - 3) + 6) * (n - 1) / ((n - 2) * (n - 3))
+
+        # Same guards as pandas: constant columns have zero skewness and kurtosis,
+        # and the statistics need at least 3 and 4 rows respectively
+        flat = np.abs(d2.sum(axis=0)) < 1e-14
+        skewness = np.where(flat, 0.0, skewness) if n >= 3 else np.full_like(m2, np.nan)
+        kurtosis = np.where(flat, 0.0, kurtosis) if n >= 4 else np.full_like(m2, np.nan)
+
         additional_stats = {
-            'median': self.df_clean.select_dtypes(include=[np.number]).median(),
-            'mode': self.df_clean.select_dtypes(include=[np.number]).mode().iloc[0],
-            'std_dev': self.df_clean.select_dtypes(include=[np.number]).std(),
-            'variance': self.df_clean.select_dtypes(include=[np.number]).var(),
-            'skewness': self.df_clean.select_dtypes(include=[np.number]).skew(),
-            'kurtosis': self.df_clean.select_dtypes(include=[np.number]).kurtosis()
+            'median': num.median(),
+            'mode': num.mode().iloc[0],
+            'std_dev': pd.Series(np.sqrt(variance), index=num.columns),
+            'variance': pd.Series(variance, index=num.columns),
+            'skewness': pd.Series(skewness, index=num.columns),
+            'kurtosis': pd.Series(kurtosis, index=num.columns)
         }
 
         self.analysis_results['basic_stats'] = {
@@ -65,14 +115,39 @@ class MedicalInsuranceAnalyzer:
         """
         print("🔗 Performing correlation analysis...")
 
-        corr_matrix = self.df_clean.corr()
-
-        # Find strongest correlations with charges
-        charges_corr = corr_matrix['charges'].drop('charges').abs().sort_values(ascending=False)
+        # Clean data has no missing values, so correlate the raw numeric block directly:
+        # standardise each column, take one X.T @ X product and mirror its upper triangle
+        numeric_df = self.df_clean.select_dtypes(include=[np.number])
+        cols = numeric_df.columns
+        arr = numeric_df.to_numpy(dtype=np.float64)
+        with warnings.catch_warnings():
+            # Constant columns cannot be standardised and correlate as NaN
+            warnings.simplefilter('ignore')
+            Xc = (arr - arr.mean(axis=0)) / arr.std(axis=0)
+        C = np.triu(Xc.T @ Xc) / len(arr)
+        C = np.clip(C + C.T - np.diag(np.diag(C)), -1, 1)
+        corr_matrix = pd.DataFrame(C, index=cols, columns=cols)
+
+        # Find strongest correlations with charges, ranking the raw matrix row
+        # so the result Series is built once, already in order
+        target = cols.get_loc('charges')
+        predictors = np.delete(np.arange(len(cols)), target)
+        abs_corr = np.abs(C[target, predictors])
+        order = np.argsort(-abs_corr, kind='stable')
+        charges_corr = pd.Series(abs_corr[order], index=cols[predictors[order]], name='charges')
+
+        # Significance of every predictor at once: t = r * sqrt((n - 2) / (1 - r^2))
+        r = C[target, predictors[order]]
+        dof = len(arr) - 2
+        with np.errstate(divide='ignore'):
+            # A perfect correlation (|r| = 1) gives an infinite t and a p-value of 0
+            t_stats = r * np.sqrt(dof / (1 - r ** 2))
+        p_values = pd.Series(2 * stats.t.sf(np.abs(t_stats), dof), index=charges_corr.index, name='p_value')
 
         self.analysis_results['correlation'] = {
             'matrix': corr_matrix,
             'charges_correlations': charges_corr,
+            'charges_p_values': p_values,
             'strongest_predictor': charges_corr.index[0],
             'strongest_correlation': charges_corr.iloc[0]
         }
@@ -90,36 +165,47 @@ class MedicalInsuranceAnalyzer:
 
         group_results = {}
 
-        if 'smoker_label' in self.df_labeled.columns:
+        if self._has_labels['smoker_label']:
             # Smoker analysis
-            smoker_stats = self.df_labeled.groupby('smoker_label')['charges'].agg([
-                'count', 'mean', 'median', 'std', 'min', 'max'
-            ])
+            smoker_stats = self._charges_by(self.df_labeled, 'smoker_label')
             group_results['smoker'] = smoker_stats
 
-        if 'sex_label' in self.df_labeled.columns:
+        if self._has_labels['sex_label']:
             # Sex analysis
-            sex_stats = self.df_labeled.groupby('sex_label')['charges'].agg([
-                'count', 'mean', 'median', 'std', 'min', 'max'
-            ])
+            sex_stats = self._charges_by(self.df_labeled, 'sex_label')
             group_results['sex'] = sex_stats
 
-        if 'region_label' in self.df_labeled.columns:
+        if self._has_labels['region_label']:
             # Region analysis
-            region_stats = self.df_labeled.groupby('region_label')['charges'].agg([
-                'count', 'mean', 'median', 'std', 'min', 'max'
-            ])
+            region_stats = self._charges_by(self.df_labeled, 'region_label')
             group_results['region'] = region_stats
 
         # Children analysis
-        children_stats = self.df_clean.groupby('children')['charges'].agg([
-            'count', 'mean', 'median', 'std', 'min', 'max'
-        ])
+        children_stats = self._charges_by(self.df_clean, 'children')
         group_results['children'] = children_stats
 
         self.analysis_results['groups'] = group_results
         return group_results
 
+    def _charges_by(self, df, col):
+        """
+        Aggregate charges for each group of a column.
+
+        Parameters:
+        df (pd.DataFrame): Dataset to group
+        col (str): Column to group by
+
+        Returns:
+        pd.DataFrame: count, mean, median, std, min and max of charges per group
+        """
+        # Only materialise groups that occur; label columns are categorical
+        grouped = df.groupby(col, observed=True)['charges']
+
+        # Reducible statistics share one aggregation pass; median is computed on its own
+        group_stats = grouped.agg(['count', 'mean', 'std', 'min', 'max'])
+        group_stats.insert(2, 'median', grouped.median())
+        return group_stats
+
     def statistical_tests(self):
         """
         Perform statistical tests for group differences.
@@ -132,11 +218,10 @@ class MedicalInsuranceAnalyzer:
         test_results = {}
 
         # T-test for smoker vs non-smoker charges
-        if 'smoker_label' in self.df_labeled.columns:
-            smoker_charges = self.df_labeled[self.df_labeled['smoker_label'] == 'yes']['charges']
-            nonsmoker_charges = self.df_labeled[self.df_labeled['smoker_label'] == 'no']['charges']
+        if self._has_labels['smoker_label']:
+            smoker_stats = self._group_stats('smoker', 'smoker_label')
 
-            t_stat, p_value = stats.ttest_ind(smoker_charges, nonsmoker_charges)
+            t_stat, p_value = self._ttest_from_stats(smoker_stats, 'yes', 'no')
             test_results['smoker_ttest'] = {
                 't_statistic': t_stat,
                 'p_value': p_value,
@@ -144,11 +229,10 @@ class MedicalInsuranceAnalyzer:
             }
 
         # T-test for male vs female charges
-        if 'sex_label' in self.df_labeled.columns:
-            male_charges = self.df_labeled[self.df_labeled['sex_label'] == 'male']['charges']
-            female_charges = self.df_labeled[self.df_labeled['sex_label'] == 'female']['charges']
+        if self._has_labels['sex_label']:
+            sex_stats = self._group_stats('sex', 'sex_label')
 
-            t_stat, p_value = stats.ttest_ind(male_charges, female_charges)
+            t_stat, p_value = self._ttest_from_stats(sex_stats, 'male', 'female')
             test_results['sex_ttest'] = {
                 't_statistic': t_stat,
                 'p_value': p_value,
@@ -156,9 +240,10 @@ class MedicalInsuranceAnalyzer:
             }
 
         # ANOVA for regional differences
-        if 'region_label' in self.df_labeled.columns:
-            region_groups = [group['charges'].values for name, group in self.df_labeled.groupby('region_label')]
-            f_stat, p_value = stats.f_oneway(*region_groups)
+        if self._has_labels['region_label']:
+            charges = self.df_labeled['charges'].to_numpy()
+            region_groups = self._split_charges(charges, 'region_label')
+            f_stat, p_value = stats.f_oneway(*region_groups.values())
             test_results['region_anova'] = {
                 'f_statistic': f_stat,
                 'p_value': p_value,
@@ -168,6 +253,71 @@ class MedicalInsuranceAnalyzer:
         self.analysis_results['statistical_tests'] = test_results
         return test_results
 
+    def _group_stats(self, group_key, label_col):
+        """
+        Get per-group charges statistics, reusing group_analysis results when present.
+
+        Parameters:
+        group_key (str): Key of the group in the group analysis results
+        label_col (str): Label column to group by if no results are cached
+
+        Returns:
+        pd.DataFrame: Per-group charges statistics
+        """
+        group_results = self.analysis_results.get('groups', {})
+        if group_key in group_results:
+            return group_results[group_key]
+        return self._charges_by(self.df_labeled, label_col)
+
+    def _ttest_from_stats(self, group_stats, first, second):
+        """
+        Two-sample Student's t-test computed from per-group count, mean and std.
+
+        Parameters:
+        group_stats (pd.DataFrame): Per-group charges statistics
+        first (str): Label of the first group
+        second (str): Label of the second group
+
+        Returns:
+        tuple: t statistic and two-sided p-value, both NaN when either group
+        has no rows
+        """
+        # Groups are observed-only, so a label without rows is absent from the table
+        if first not in group_stats.index or second not in group_stats.index:
+            return np.nan, np.nan
+
+        n1, m1, s1 = group_stats.loc[first, ['count', 'mean', 'std']]
+        n2, m2, s2 = group_stats.loc[second, ['count', 'mean', 'std']]
+
+        dof = n1 + n2 - 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Single-row groups leave no degrees of freedom and give NaN
+            pooled_var = ((n1 - 1) * s1 ** 2 + (n2 - 1) * s2 ** 2) / dof
+            t_stat = (m1 - m2) / np.sqrt(pooled_var * (1 / n1 + 1 / n2))
+        p_value = 2 * stats.t.sf(abs(t_stat), dof)
+        return t_stat, p_value
+
+    def _split_charges(self, charges, label_col):
+        """
+        Split the charges array into one array per label.
+
+        Parameters:
+        charges (np.ndarray): Charges aligned with df_labeled rows
+        label_col (str): Label column to split on
+
+        Returns:
+        dict: Mapping of label to its charges array, in sorted label order
+        """
+        # Split on integer codes; rows with a missing label (code -1) are dropped
+        codes, names = pd.factorize(self.df_labeled[label_col], sort=True)
+        keep = codes >= 0
+        codes, charges = codes[keep], charges[keep]
+
+        order = np.argsort(codes, kind='stable')
+        _, starts = np.unique(codes[order], return_index=True)
+        splits = np.split(charges[order], starts[1:])
+        return dict(zip(names, splits))
+
     def generate_insights(self):
         """
         Generate key insights from the analysis.
@@ -281,8 +431,16 @@ class MedicalInsuranceAnalyzer:
             else:
                 exportable_results[key] = value
 
-        with open(output_path, 'w') as f:
-            json.dump(exportable_results, f, indent=2, default=str)
+        if orjson is not None:
+            data = orjson.dumps(
+                exportable_results, default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+            )
+            with open(output_path, 'wb') as f:
+                f.write(data)
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(exportable_results, f, indent=2, default=_json_default)
 
         print(f"✅ Results exported to: {output_path}")
 
@@ -7,11 +7,18 @@ Author: Data Analysis System
 Date: Sepetember 2025
 """
 
+import csv
+import os
 import pandas as pd
 import numpy as np
 import requests
-import warnings
-warnings.filterwarnings('ignore')
+
+# Use PyArrow's multi-threaded CSV parser when it is installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
 
 class MedicalInsuranceDataLoader:
     """
@@ -52,14 +59,16 @@ class MedicalInsuranceDataLoader:
 
         try:
             print(f"📥 Downloading data from: {self.url}")
-            response = requests.get(self.url)
-            response.raise_for_status()
+            # Stream straight to disk so the file is never held in memory as a whole
+            with requests.get(self.url, stream=True) as response:
+                response.raise_for_status()
 
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
+                with open(save_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
 
             self.local_path = save_path
-            file_size = len(response.content)
+            file_size = os.path.getsize(save_path)
             print(f"✅ Downloaded successfully: {file_size:,} bytes")
             return True
 
@@ -79,20 +88,21 @@ class MedicalInsuranceDataLoader:
             return None
 
         try:
-            # Check if file has header
-            with open(self.local_path, 'r') as f:
-                first_line = f.readline().strip()
+            # Check if file has header from a small sample, trimmed to whole lines
+            with open(self.local_path, 'r', newline='') as f:
+                sample = f.read(4096)
+            sample = sample[:sample.rfind('\n') + 1] or sample
 
-            contains_numbers = any(char.isdigit() for char in first_line)
+            has_header = csv.Sniffer().has_header(sample)
 
-            if contains_numbers:
+            if not has_header:
                 # No header, add column names
                 column_names = ['age', 'sex', 'bmi', 'children', 'smoker', 'region', 'charges']
-                self.df_raw = pd.read_csv(self.local_path, names=column_names)
+                self.df_raw = pd.read_csv(self.local_path, names=column_names, engine=CSV_ENGINE)
                 print(f"✅ Loaded data with inferred columns: {column_names}")
             else:
                 # Has header
-                self.df_raw = pd.read_csv(self.local_path)
+                self.df_raw = pd.read_csv(self.local_path, engine=CSV_ENGINE)
                 print(f"✅ Loaded data with existing columns: {list(self.df_raw.columns)}")
 
             print(f"📊 Dataset shape: {self.df_raw.shape}")
@@ -106,6 +116,9 @@ class MedicalInsuranceDataLoader:
         """
         Clean and preprocess the dataset.
 
+        The raw data is cleaned in place and released afterwards, so load_data
+        must be called again before cleaning a second time.
+
         Returns:
         pd.DataFrame: Cleaned dataset
         """
@@ -114,7 +127,7 @@ class MedicalInsuranceDataLoader:
             return None
 
         print("🧹 Starting data cleaning...")
-        self.df_clean = self.df_raw.copy()
+        self.df_clean = self.df_raw
 
         # Clean age column
         print("  • Cleaning age column...")
@@ -127,55 +140,96 @@ class MedicalInsuranceDataLoader:
 
         # Clean smoker column
         print("  • Cleaning smoker column...")
-        smoker_mode = self.df_clean['smoker'].mode()[0] if '?' not in str(self.df_clean['smoker'].mode().values) else '0'
-        self.df_clean['smoker'] = self.df_clean['smoker'].replace('?', smoker_mode)
-        self.df_clean['smoker'] = pd.to_numeric(self.df_clean['smoker'])
+        smoker = self.df_clean['smoker']
+        known_smoker = smoker[smoker != '?']
+        smoker_mode = known_smoker.value_counts().idxmax() if len(known_smoker) else '0'
+        self.df_clean['smoker'] = pd.to_numeric(smoker.replace('?', smoker_mode))
 
-        # Convert data types
+        # Convert data types (smallest integer widths that hold each column's range)
         print("  • Converting data types...")
-        self.df_clean['age'] = self.df_clean['age'].astype(int)
-        self.df_clean['sex'] = self.df_clean['sex'].astype(int)
-        self.df_clean['children'] = self.df_clean['children'].astype(int)
-        self.df_clean['smoker'] = self.df_clean['smoker'].astype(int)
-        self.df_clean['region'] = self.df_clean['region'].astype(int)
+        self.df_clean['age'] = self.df_clean['age'].astype(np.int16)
+        self.df_clean['sex'] = self.df_clean['sex'].astype(np.int8)
+        self.df_clean['children'] = self.df_clean['children'].astype(np.int8)
+        self.df_clean['smoker'] = self.df_clean['smoker'].astype(np.int8)
+        self.df_clean['region'] = self.df_clean['region'].astype(np.int8)
+
+        self.df_raw = None
 
         print(f"✅ Cleaning complete. Missing values: {self.df_clean.isnull().sum().sum()}")
         return self.df_clean
 
     def create_labeled_data(self):
         """
-        Create a labeled version with human-readable categories.
+        Add human-readable categorical label columns to the cleaned dataset.
+
+        The *_label columns are added to df_clean in place, so the same frame
+        serves as both the numerical and the labeled dataset.
 
         Returns:
-        pd.DataFrame: Labeled dataset
+        pd.DataFrame: Cleaned dataset with label columns
         """
         if self.df_clean is None:
             print("❌ No clean data available. Clean data first.")
             return None
 
-        df_labeled = self.df_clean.copy()
-        df_labeled['sex_label'] = df_labeled['sex'].map(self.label_mappings['sex'])
-        df_labeled['smoker_label'] = df_labeled['smoker'].map(self.label_mappings['smoker'])
-        df_labeled['region_label'] = df_labeled['region'].map(self.label_mappings['region'])
+        self.df_clean['sex_label'] = self._to_categorical(self.df_clean['sex'])
+        self.df_clean['smoker_label'] = self._to_categorical(self.df_clean['smoker'])
+        self.df_clean['region_label'] = self._to_categorical(self.df_clean['region'])
+
+        return self.df_clean
+
+    def _to_categorical(self, series):
+        """
+        Convert an integer-coded column to its labelled categorical form.
+
+        Parameters:
+        series (pd.Series): Integer-coded column named after a label mapping
+
+        Returns:
+        pd.Categorical: Labels built directly from the integer codes
+        """
+        mapping = self.label_mappings[series.name]
+        first = min(mapping)
+        categories = [mapping[code] for code in range(first, first + len(mapping))]
+
+        # Shift codes to start at zero; anything outside the mapping becomes missing
+        codes = series.to_numpy() - first
+        codes = np.where((codes >= 0) & (codes < len(categories)), codes, -1)
+        return pd.Categorical.from_codes(codes, categories=categories)
 
-        return df_labeled
+    def get_clean_columns(self):
+        """
+        Get the cleaned dataset's own columns, leaving out the label columns
+        added by create_labeled_data.
+
+        Returns:
+        list: Column names of the cleaned dataset
+        """
+        if self.df_clean is None:
+            return []
+
+        label_columns = {f'{col}_label' for col in self.label_mappings}
+        return [col for col in self.df_clean.columns if col not in label_columns]
 
     def get_data_summary(self):
         """
-        Get a summary of the dataset.
+        Get a summary of the cleaned dataset, excluding any label columns.
 
         Returns:
-        dict: Summary statistics
+        dict: Summary statistics, with missing_values as the total count
         """
         if self.df_clean is None:
             return {"error": "No clean data available"}
 
+        df = self.df_clean[self.get_clean_columns()]
+
+        # Whole-frame reductions; every column is numeric after cleaning
         return {
-            "shape": self.df_clean.shape,
-            "columns": list(self.df_clean.columns),
-            "missing_values": self.df_clean.isnull().sum().to_dict(),
-            "data_types": self.df_clean.dtypes.to_dict(),
-            "memory_usage_kb": self.df_clean.memory_usage(deep=True).sum() / 1024
+            "shape": df.shape,
+            "columns": list(df.columns),
+            "missing_values": int(df.isna().to_numpy().sum()),
+            "data_types": df.dtypes.to_dict(),
+            "memory_usage_kb": float(df.memory_usage(deep=False, index=True).sum()) / 1024
         }
 
 # Example usage
@@ -7,34 +7,192 @@ Author: Data Analysis System
 Date: September 2025
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib
+import matplotlib.style
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import ListedColormap
+from matplotlib.ticker import FuncFormatter
 import warnings
-warnings.filterwarnings('ignore')
+
+# Fixed palettes shared by every chart call
+_BAR_PALETTE = ('#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#F7DC6F')
+_SCATTER_COLORS = ('blue', 'red', 'green', 'orange')
+
+def _format_currency(x, pos):
+    """
+    Format an axis tick value as whole dollars.
+
+    Parameters:
+    x (float): Tick value
+    pos (int): Tick position
+
+    Returns:
+    str: Formatted tick label
+    """
+    return f'${x:,.0f}'
+
+def _ensure_sns():
+    """
+    Import seaborn on first use and apply the plotting palette.
+
+    Seaborn is imported lazily so that importing this module stays cheap for
+    callers that never draw a plot.
+
+    Returns:
+    module: The seaborn module
+    """
+    import seaborn as sns
+    sns.set_palette("husl")
+    return sns
+
+def _new_figure(figsize, nrows=1, ncols=1):
+    """
+    Create a figure on its own Agg canvas, independent of pyplot's global state.
+
+    Parameters:
+    figsize (tuple): Figure size in inches
+    nrows (int): Number of subplot rows
+    ncols (int): Number of subplot columns
+
+    Returns:
+    tuple: The figure and its axes
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(nrows, ncols)
+
+def _render_plot(visualizer, method_name, save_path):
+    """
+    Render one plot in a worker process.
+
+    Parameters:
+    visualizer (MedicalInsuranceVisualizer): Visualizer holding the data
+    method_name (str): Name of the create_* method to call
+    save_path (str): Path to save the plot
+
+    Returns:
+    matplotlib.figure.Figure: The created figure
+    """
+    visualizer._apply_style()
+    return getattr(visualizer, method_name)(save_path=save_path)
 
 class MedicalInsuranceVisualizer:
     """
     A class to create comprehensive visualizations for medical insurance data.
     """
 
-    def __init__(self, df_clean, df_labeled=None):
+    # Plots written by create_all_required_plots: (name, method name, file name,
+    # columns the plot reads - None means every numeric column)
+    PLOT_SPECS = (
+        ('line_chart', 'create_line_chart', 'line_chart_age_vs_charges.png', ('age', 'charges')),
+        ('bar_chart', 'create_bar_chart', 'bar_chart_region_charges.png', ('region', 'region_label', 'charges')),
+        ('histogram', 'create_histogram', 'histogram_bmi_distribution.png', ('bmi',)),
+        ('scatter_plot', 'create_scatter_plot', 'scatter_plot_bmi_vs_charges.png', ('bmi', 'charges', 'smoker_label')),
+        ('correlation_heatmap', 'create_correlation_heatmap', 'correlation_heatmap.png', None),
+        ('box_plots', 'create_box_plots', 'box_plots_categorical.png',
+         ('charges', 'children', 'smoker_label', 'sex_label', 'region_label')),
+    )
+
+    def __init__(self, df_clean, df_labeled=None, save_dpi=150, save_bbox=None):
         """
         Initialize the visualizer with clean data.
 
         Parameters:
         df_clean (pd.DataFrame): Cleaned numerical dataset
         df_labeled (pd.DataFrame): Dataset with human-readable labels
+        save_dpi (int): Resolution used when saving plots
+        save_bbox (str): bbox_inches used when saving plots (e.g. 'tight')
         """
         self.df_clean = df_clean
         self.df_labeled = df_labeled if df_labeled is not None else df_clean
+        self.save_dpi = save_dpi
+        self.save_bbox = save_bbox
+
+        # Group and plot on integer category codes rather than hashing label strings;
+        # converted columns go on a new frame so the caller's data is left untouched
+        converted = {
+            col: self.df_labeled[col].astype('category')
+            for col in ('smoker_label', 'sex_label', 'region_label')
+            if col in self.df_labeled.columns
+            and not isinstance(self.df_labeled[col].dtype, pd.CategoricalDtype)
+        }
+        if converted:
+            self.df_labeled = self.df_labeled.assign(**converted)
+
+        # Aggregations shared between plots, computed once per (data, columns) key
+        self._agg_cache = {}
+
+        self._apply_style()
+
+    def __getstate__(self):
+        """
+        Drop cached aggregations when pickling for worker processes, since their
+        keys hold object ids that are meaningless in another process.
+        """
+        state = self.__dict__.copy()
+        state['_agg_cache'] = {}
+        return state
+
+    def _apply_style(self):
+        """
+        Set up plotting style.
+        """
+        matplotlib.style.use('default')
+        _ensure_sns()
+        matplotlib.rcParams['figure.figsize'] = (12, 8)
+        matplotlib.rcParams['font.size'] = 10
+
+    def _grouped_mean(self, df, x_col, y_col):
+        """
+        Get the mean of y_col for each value of x_col, caching the result.
 
-        # Set up plotting style
-        plt.style.use('default')
-        sns.set_palette("husl")
-        plt.rcParams['figure.figsize'] = (12, 8)
-        plt.rcParams['font.size'] = 10
+        Parameters:
+        df (pd.DataFrame): Dataset to group
+        x_col (str): Column to group by
+        y_col (str): Column to average
+
+        Returns:
+        pd.Series: Mean of y_col indexed by x_col
+        """
+        key = (id(df), x_col, y_col, 'mean')
+        if key not in self._agg_cache:
+            grouped = self._integer_key_mean(df, x_col, y_col)
+            if grouped is None:
+                grouped = df.groupby(x_col, observed=True)[y_col].mean()
+            self._agg_cache[key] = grouped
+        return self._agg_cache[key]
+
+    def _integer_key_mean(self, df, x_col, y_col):
+        """
+        Group mean for small non-negative integer keys such as age or children,
+        using one weighted bincount pass instead of a hash-based groupby.
+
+        Parameters:
+        df (pd.DataFrame): Dataset to group
+        x_col (str): Integer column to group by
+        y_col (str): Column to average
+
+        Returns:
+        pd.Series: Mean of y_col indexed by x_col, or None if the keys are unsuitable
+        """
+        if not pd.api.types.is_integer_dtype(df[x_col]) or not pd.api.types.is_numeric_dtype(df[y_col]):
+            return None
+
+        keys = df[x_col].to_numpy(dtype=np.int64)
+        vals = df[y_col].to_numpy(dtype=np.float64)
+        if len(keys) == 0 or keys.min() < 0 or keys.max() > 2 * len(keys) or np.isnan(vals).any():
+            return None
+
+        sums = np.bincount(keys, weights=vals)
+        counts = np.bincount(keys)
+        present = np.flatnonzero(counts)
+        return pd.Series(sums[present] / counts[present],
+                         index=pd.Index(present, name=x_col), name=y_col)
 
     def create_line_chart(self, x_col='age', y_col='charges', save_path=None):
         """
@@ -51,15 +209,16 @@ class MedicalInsuranceVisualizer:
         print(f"📈 Creating line chart: {y_col} vs {x_col}")
 
         # Group by x_col and calculate mean y_col
-        grouped_data = self.df_clean.groupby(x_col)[y_col].mean().reset_index()
+        grouped_data = self._grouped_mean(self.df_clean, x_col, y_col).reset_index()
+        x = grouped_data[x_col].to_numpy(dtype=np.float64, copy=False)
+        y = grouped_data[y_col].to_numpy(dtype=np.float64, copy=False)
 
-        fig, ax = plt.subplots(figsize=(12, 6))
-        ax.plot(grouped_data[x_col], grouped_data[y_col], marker='o', linewidth=2, markersize=4)
+        fig, ax = _new_figure((12, 6))
+        ax.plot(x, y, marker='o', linewidth=2, markersize=4)
 
         # Add trend line
-        z = np.polyfit(grouped_data[x_col], grouped_data[y_col], 1)
-        p = np.poly1d(z)
-        ax.plot(grouped_data[x_col], p(grouped_data[x_col]), "--", alpha=0.7, color='red',
+        z = np.polyfit(x, y, 1)
+        ax.plot(x, np.polyval(z, x), "--", alpha=0.7, color='red',
                 label=f'Trend Line (slope: ${z[0]:.0f} per unit)')
 
         ax.set_title(f'{y_col.title()} Trend by {x_col.title()}', fontsize=16, fontweight='bold')
@@ -69,12 +228,12 @@ class MedicalInsuranceVisualizer:
         ax.legend()
 
         # Format y-axis for currency
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+        ax.yaxis.set_major_formatter(FuncFormatter(_format_currency))
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.save_dpi, bbox_inches=self.save_bbox)
             print(f"✅ Line chart saved to: {save_path}")
 
         return fig
@@ -95,19 +254,16 @@ class MedicalInsuranceVisualizer:
 
         # Calculate averages by category
         if x_col in self.df_labeled.columns:
-            grouped_data = self.df_labeled.groupby(x_col)[y_col].mean().sort_values(ascending=False)
+            grouped_data = self._grouped_mean(self.df_labeled, x_col, y_col).sort_values(ascending=False)
         else:
-            grouped_data = self.df_clean.groupby(x_col)[y_col].mean().sort_values(ascending=False)
+            grouped_data = self._grouped_mean(self.df_clean, x_col, y_col).sort_values(ascending=False)
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#F7DC6F'][:len(grouped_data)]
-        bars = ax.bar(grouped_data.index, grouped_data.values, color=colors, alpha=0.8)
+        fig, ax = _new_figure((10, 6))
+        bars = ax.bar(grouped_data.index, grouped_data.values,
+                      color=_BAR_PALETTE[:len(grouped_data)], alpha=0.8)
 
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                   f'${height:,.0f}', ha='center', va='bottom', fontweight='bold')
+        ax.bar_label(bars, labels=[f'${v:,.0f}' for v in grouped_data.values], padding=3, fontweight='bold')
 
         ax.set_title(f'Average {y_col.title()} by {x_col.replace("_label", "").title()}', 
                     fontsize=16, fontweight='bold')
@@ -117,12 +273,12 @@ class MedicalInsuranceVisualizer:
         ax.grid(True, alpha=0.3, axis='y')
 
         # Format y-axis for currency
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+        ax.yaxis.set_major_formatter(FuncFormatter(_format_currency))
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.save_dpi, bbox_inches=self.save_bbox)
             print(f"✅ Bar chart saved to: {save_path}")
 
         return fig
@@ -141,14 +297,22 @@ class MedicalInsuranceVisualizer:
         """
         print(f"📊 Creating histogram: {col} distribution")
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        # Materialise the column once and take every statistic from the same array
+        arr = self.df_clean[col].to_numpy(dtype=np.float64, copy=False)
+        mean_val = arr.mean()
+        median_val = np.median(arr)
+        std_val = arr.std(ddof=1)
+        min_val = arr.min()
+        max_val = arr.max()
 
-        n, bins_used, patches = ax.hist(self.df_clean[col], bins=bins, alpha=0.7, 
-                                       color='skyblue', edgecolor='black', linewidth=0.5)
+        fig, ax = _new_figure((10, 6))
+
+        # Bin once with numpy and draw the outline as a single step artist
+        counts, edges = np.histogram(arr, bins=bins)
+        ax.stairs(counts, edges, fill=True, alpha=0.7,
+                  facecolor='skyblue', edgecolor='black', linewidth=0.5)
 
         # Add statistics lines
-        mean_val = self.df_clean[col].mean()
-        median_val = self.df_clean[col].median()
 
         ax.axvline(mean_val, color='red', linestyle='--', linewidth=2, 
                   label=f'Mean: {mean_val:.2f}')
@@ -162,15 +326,20 @@ class MedicalInsuranceVisualizer:
         ax.grid(True, alpha=0.3, axis='y')
 
         # Add statistics text box
-        stats_text = f'Total: {len(self.df_clean):,}\nStd Dev: {self.df_clean[col].std():.2f}\nMin: {self.df_clean[col].min():.2f}\nMax: {self.df_clean[col].max():.2f}'
+        stats_text = "\n".join((
+            f'Total: {arr.size:,}',
+            f'Std Dev: {std_val:.2f}',
+            f'Min: {min_val:.2f}',
+            f'Max: {max_val:.2f}',
+        ))
         ax.text(0.75, 0.95, stats_text, transform=ax.transAxes,
                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
                verticalalignment='top', fontsize=10)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.save_dpi, bbox_inches=self.save_bbox)
             print(f"✅ Histogram saved to: {save_path}")
 
         return fig
@@ -190,50 +359,58 @@ class MedicalInsuranceVisualizer:
         """
         print(f"📊 Creating scatter plot: {x_col} vs {y_col}")
 
-        fig, ax = plt.subplots(figsize=(12, 8))
+        x = self.df_clean[x_col].to_numpy(dtype=np.float64, copy=False)
+        y = self.df_clean[y_col].to_numpy(dtype=np.float64, copy=False)
+
+        fig, ax = _new_figure((12, 8))
 
-        # Plot points with color coding
+        # Plot points with color coding; the point clouds are rasterized so vector
+        # outputs (PDF/SVG) embed one image instead of a path per point
+        category_handles, category_labels = [], []
         if hue_col and hue_col in self.df_labeled.columns:
-            unique_categories = self.df_labeled[hue_col].unique()
-            colors = ['blue', 'red', 'green', 'orange']
-
-            for i, category in enumerate(unique_categories):
-                subset = self.df_labeled[self.df_labeled[hue_col] == category]
-                ax.scatter(subset[x_col], subset[y_col], 
-                         alpha=0.6, s=30, c=colors[i % len(colors)], 
-                         label=f'{category} (n={len(subset)})')
+            # One scatter call for all categories, colored by their integer codes
+            codes, unique_categories = pd.factorize(self.df_labeled[hue_col])
+            cmap = ListedColormap([_SCATTER_COLORS[i % len(_SCATTER_COLORS)]
+                                   for i in range(len(unique_categories))])
+            valid = codes >= 0
+            counts = np.bincount(codes[valid], minlength=len(unique_categories))
+
+            sc = ax.scatter(self.df_labeled[x_col].to_numpy()[valid], self.df_labeled[y_col].to_numpy()[valid],
+                            c=codes[valid], cmap=cmap, vmin=0, vmax=max(len(unique_categories) - 1, 1),
+                            alpha=0.6, s=30, rasterized=True)
+            category_handles = sc.legend_elements()[0]
+            category_labels = [f'{category} (n={n})' for category, n in zip(unique_categories, counts)]
         else:
-            ax.scatter(self.df_clean[x_col], self.df_clean[y_col], 
-                      alpha=0.6, s=30, c='blue')
+            ax.scatter(x, y, alpha=0.6, s=30, c='blue', rasterized=True)
 
         # Add trend line
-        z = np.polyfit(self.df_clean[x_col], self.df_clean[y_col], 1)
-        p = np.poly1d(z)
-        x_range = np.linspace(self.df_clean[x_col].min(), self.df_clean[x_col].max(), 100)
-        ax.plot(x_range, p(x_range), "--", alpha=0.8, color='green',
-               label=f'Trend (r={self.df_clean[x_col].corr(self.df_clean[y_col]):.3f})')
+        z = np.polyfit(x, y, 1)
+        corr_coef = np.corrcoef(x, y)[0, 1]
+        x_range = np.linspace(x.min(), x.max(), 100)
+        ax.plot(x_range, np.polyval(z, x_range), "--", alpha=0.8, color='green',
+               label=f'Trend (r={corr_coef:.3f})')
 
         ax.set_title(f'{x_col.upper()} vs {y_col.title()}', fontsize=16, fontweight='bold')
         ax.set_xlabel(f'{x_col.upper()}', fontsize=12)
         ax.set_ylabel(f'{y_col.title()} ($)', fontsize=12)
-        ax.legend()
+        handles, labels = ax.get_legend_handles_labels()
+        ax.legend(handles=category_handles + handles, labels=category_labels + labels)
         ax.grid(True, alpha=0.3)
 
         # Format y-axis for currency if it's charges
         if 'charge' in y_col.lower():
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+            ax.yaxis.set_major_formatter(FuncFormatter(_format_currency))
 
         # Add correlation text
-        corr_coef = self.df_clean[x_col].corr(self.df_clean[y_col])
         ax.text(0.05, 0.95, f'Correlation: {corr_coef:.3f}', 
                transform=ax.transAxes,
                bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8),
                fontsize=12, fontweight='bold')
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.save_dpi, bbox_inches=self.save_bbox)
             print(f"✅ Scatter plot saved to: {save_path}")
 
         return fig
@@ -249,23 +426,34 @@ class MedicalInsuranceVisualizer:
         matplotlib.figure.Figure: The created figure
         """
         print("🔥 Creating correlation heatmap")
+        sns = _ensure_sns()
+
+        fig, ax = _new_figure((10, 8))
 
-        fig, ax = plt.subplots(figsize=(10, 8))
+        # Correlate numeric columns only, so no object columns are coerced
+        if 'corr' not in self._agg_cache:
+            numeric_df = self.df_clean.select_dtypes(include=[np.number])
+            self._agg_cache['corr'] = (numeric_df.corr().to_numpy(), numeric_df.columns)
+        corr_matrix, labels = self._agg_cache['corr']
 
-        corr_matrix = self.df_clean.corr()
-        mask = np.triu(np.ones_like(corr_matrix, dtype=bool))
+        # Hide the redundant upper triangle but keep the diagonal
+        mask = np.triu(np.ones(corr_matrix.shape, dtype=bool), k=1)
 
-        sns.heatmap(corr_matrix, annot=True, cmap='RdYlBu_r', center=0,
-                   mask=mask, square=True, fmt='.3f',
-                   cbar_kws={"shrink": .8}, ax=ax)
+        with warnings.catch_warnings():
+            # Seaborn calls colormap APIs that newer matplotlib flags as deprecated
+            warnings.simplefilter('ignore', PendingDeprecationWarning)
+            sns.heatmap(corr_matrix, annot=True, cmap='RdYlBu_r', center=0,
+                       mask=mask, square=True, fmt='.3f',
+                       xticklabels=labels, yticklabels=labels,
+                       cbar_kws={"shrink": .8}, ax=ax)
 
         ax.set_title('Correlation Matrix Heatmap\n(Medical Insurance Dataset)', 
                     fontsize=16, fontweight='bold')
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.save_dpi, bbox_inches=self.save_bbox)
             print(f"✅ Correlation heatmap saved to: {save_path}")
 
         return fig
@@ -281,94 +469,135 @@ class MedicalInsuranceVisualizer:
         matplotlib.figure.Figure: The created figure
         """
         print("📦 Creating box plots")
-
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-
-        # Box plot 1: Charges by Smoker
-        if 'smoker_label' in self.df_labeled.columns:
-            sns.boxplot(data=self.df_labeled, x='smoker_label', y='charges', ax=axes[0,0])
-            axes[0,0].set_title('Charges by Smoking Status', fontweight='bold')
-            axes[0,0].yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-
-        # Box plot 2: Charges by Sex
-        if 'sex_label' in self.df_labeled.columns:
-            sns.boxplot(data=self.df_labeled, x='sex_label', y='charges', ax=axes[0,1])
-            axes[0,1].set_title('Charges by Sex', fontweight='bold')
-            axes[0,1].yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-
-        # Box plot 3: Charges by Region
-        if 'region_label' in self.df_labeled.columns:
-            sns.boxplot(data=self.df_labeled, x='region_label', y='charges', ax=axes[1,0])
-            axes[1,0].set_title('Charges by Region', fontweight='bold')
-            axes[1,0].tick_params(axis='x', rotation=45)
-            axes[1,0].yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-
-        # Box plot 4: Charges by Children
-        sns.boxplot(data=self.df_clean, x='children', y='charges', ax=axes[1,1])
-        axes[1,1].set_title('Charges by Number of Children', fontweight='bold')
-        axes[1,1].yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-
-        plt.tight_layout()
+        sns = _ensure_sns()
+
+        fig, axes = _new_figure((15, 10), 2, 2)
+
+        # Sort once by the box plot keys so each plot's per-group gathers read
+        # contiguous rows
+        sort_cols = [col for col in ('smoker_label', 'sex_label', 'region_label', 'children')
+                     if col in self.df_labeled.columns]
+        df_s = self.df_labeled.sort_values(sort_cols, kind='stable').reset_index(drop=True) if sort_cols else self.df_labeled
+        df_children = df_s if 'children' in df_s.columns else self.df_clean
+
+        with warnings.catch_warnings():
+            # Seaborn's boxplot passes matplotlib's deprecated vert argument
+            warnings.simplefilter('ignore', DeprecationWarning)
+
+            # Box plot 1: Charges by Smoker
+            if 'smoker_label' in self.df_labeled.columns:
+                sns.boxplot(data=df_s, x='smoker_label', y='charges', ax=axes[0,0])
+                axes[0,0].set_title('Charges by Smoking Status', fontweight='bold')
+                axes[0,0].yaxis.set_major_formatter(FuncFormatter(_format_currency))
+
+            # Box plot 2: Charges by Sex
+            if 'sex_label' in self.df_labeled.columns:
+                sns.boxplot(data=df_s, x='sex_label', y='charges', ax=axes[0,1])
+                axes[0,1].set_title('Charges by Sex', fontweight='bold')
+                axes[0,1].yaxis.set_major_formatter(FuncFormatter(_format_currency))
+
+            # Box plot 3: Charges by Region
+            if 'region_label' in self.df_labeled.columns:
+                sns.boxplot(data=df_s, x='region_label', y='charges', ax=axes[1,0])
+                axes[1,0].set_title('Charges by Region', fontweight='bold')
+                axes[1,0].tick_params(axis='x', rotation=45)
+                axes[1,0].yaxis.set_major_formatter(FuncFormatter(_format_currency))
+
+            # Box plot 4: Charges by Children
+            sns.boxplot(data=df_children, x='children', y='charges', ax=axes[1,1])
+            axes[1,1].set_title('Charges by Number of Children', fontweight='bold')
+            axes[1,1].yaxis.set_major_formatter(FuncFormatter(_format_currency))
+
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.save_dpi, bbox_inches=self.save_bbox)
             print(f"✅ Box plots saved to: {save_path}")
 
         return fig
 
-    def create_all_required_plots(self, output_dir='/home/user/output/'):
+    def create_all_required_plots(self, output_dir='/home/user/output/', parallel=False, high_quality=False):
         """
         Create all required plots and save them.
 
         Parameters:
         output_dir (str): Directory to save all plots
+        parallel (bool): Render the plots in separate worker processes (needs 2+ CPUs)
+        high_quality (bool): Save at 300 DPI with tight bounding boxes for publishing
 
         Returns:
         dict: Dictionary of created figures
         """
         print("🎨 Creating all required visualizations...")
 
-        figures = {}
+        save_settings = (self.save_dpi, self.save_bbox)
+        if high_quality:
+            self.save_dpi, self.save_bbox = 300, 'tight'
 
-        # 1. Line chart
-        figures['line_chart'] = self.create_line_chart(
-            save_path=f'{output_dir}line_chart_age_vs_charges.png'
-        )
-        plt.close()
-
-        # 2. Bar chart
-        figures['bar_chart'] = self.create_bar_chart(
-            save_path=f'{output_dir}bar_chart_region_charges.png'
-        )
-        plt.close()
-
-        # 3. Histogram
-        figures['histogram'] = self.create_histogram(
-            save_path=f'{output_dir}histogram_bmi_distribution.png'
-        )
-        plt.close()
-
-        # 4. Scatter plot
-        figures['scatter_plot'] = self.create_scatter_plot(
-            save_path=f'{output_dir}scatter_plot_bmi_vs_charges.png'
-        )
-        plt.close()
-
-        # 5. Correlation heatmap
-        figures['correlation_heatmap'] = self.create_correlation_heatmap(
-            save_path=f'{output_dir}correlation_heatmap.png'
-        )
-        plt.close()
-
-        # 6. Box plots
-        figures['box_plots'] = self.create_box_plots(
-            save_path=f'{output_dir}box_plots_categorical.png'
-        )
-        plt.close()
+        try:
+            figures = self._render_plots(self.PLOT_SPECS, output_dir, parallel)
+        finally:
+            self.save_dpi, self.save_bbox = save_settings
 
         print("✅ All visualizations created and saved!")
         return figures
 
+    def _render_plots(self, plot_specs, output_dir, parallel):
+        """
+        Render and save a list of plots.
+
+        Parameters:
+        plot_specs (tuple): (name, method name, file name, columns) for each plot
+        output_dir (str): Directory to save all plots
+        parallel (bool): Render the plots in separate worker processes
+
+        Returns:
+        dict: Dictionary of created figures
+        """
+        figures = {}
+
+        # A pool only pays for its start-up and pickling with at least two cores
+        workers = min(len(plot_specs), os.cpu_count() or 1) if parallel else 1
+
+        if workers > 1:
+            # Each plot is independent, so render and encode them on separate cores
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    name: executor.submit(_render_plot, self._subset(columns), method_name,
+                                          os.path.join(output_dir, filename))
+                    for name, method_name, filename, columns in plot_specs
+                }
+                for name, future in futures.items():
+                    figures[name] = future.result()
+        else:
+            for name, method_name, filename, _ in plot_specs:
+                figures[name] = getattr(self, method_name)(save_path=os.path.join(output_dir, filename))
+
+        return figures
+
+    def _subset(self, columns):
+        """
+        Copy of this visualizer holding only the given columns, so a worker
+        process is sent just the data its plot reads.
+
+        Parameters:
+        columns (tuple): Columns to keep, or None for every numeric column
+
+        Returns:
+        MedicalInsuranceVisualizer: Visualizer over the selected columns
+        """
+        if columns is None:
+            columns = list(self.df_clean.select_dtypes(include=[np.number]).columns)
+
+        worker = object.__new__(type(self))
+        worker.__dict__.update(self.__getstate__())
+        worker.df_clean = self.df_clean[[col for col in columns if col in self.df_clean.columns]]
+        if self.df_labeled is self.df_clean:
+            worker.df_labeled = worker.df_clean
+        else:
+            worker.df_labeled = self.df_labeled[[col for col in columns if col in self.df_labeled.columns]]
+        return worker
+
 # Example usage
 if __name__ == "__main__":
     print("This module requires cleaned data from data_loader.py")
@@ -23,6 +23,7 @@ Requirements:
 import sys
 import os
 from datetime import datetime
+from pathlib import Path
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -37,6 +38,13 @@ except ImportError as e:
     print("Please ensure all module files are in the same directory.")
     sys.exit(1)
 
+# Parquet copies of the exported data are written when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401
+    WRITE_PARQUET = True
+except ImportError:
+    WRITE_PARQUET = False
+
 def main():
     """
     Main execution function for the complete analysis pipeline.
@@ -58,6 +66,19 @@ def main():
     print(f"📁 Output directory: {OUTPUT_DIR}")
     print()
 
+    # Every file the pipeline writes, built once - Path keeps this cross-platform
+    out = Path(OUTPUT_DIR)
+    paths = {
+        'cleaned': out / 'medical_insurance_cleaned.csv',
+        'labeled': out / 'medical_insurance_labeled.csv',
+        'cleaned_parquet': out / 'medical_insurance_cleaned.parquet',
+        'labeled_parquet': out / 'medical_insurance_labeled.parquet',
+        'results': out / 'analysis_results.json',
+        'summary': out / 'analysis_summary.txt',
+    }
+    # Plot files are named by the visualizer, which writes them
+    paths.update({name: out / filename for name, _, filename, _ in MedicalInsuranceVisualizer.PLOT_SPECS})
+
     try:
         # ===============================================
         # STEP 1: DATA LOADING AND CLEANING
@@ -84,15 +105,21 @@ def main():
             print("❌ Failed to clean data. Exiting...")
             return False
 
-        # Create labeled data
-        labeled_data = loader.create_labeled_data()
+        # Add label columns in place - one frame serves every pipeline stage
+        data = loader.create_labeled_data()
+        clean_columns = loader.get_clean_columns()
+
+        # Export cleaned data
+        data.to_csv(paths['cleaned'], columns=clean_columns, index=False)
+        data.to_csv(paths['labeled'], index=False)
 
-        # Export cleaned data - Using os.path.join for cross-platform compatibility
-        clean_data.to_csv(os.path.join(OUTPUT_DIR, "medical_insurance_cleaned.csv"), index=False)
-        labeled_data.to_csv(os.path.join(OUTPUT_DIR, "medical_insurance_labeled.csv"), index=False)
+        # Compressed columnar copies for faster re-reads by downstream tools
+        if WRITE_PARQUET:
+            data[clean_columns].to_parquet(paths['cleaned_parquet'], compression='zstd', index=False)
+            data.to_parquet(paths['labeled_parquet'], compression='zstd', index=False)
 
         print(f"✅ Data loading and cleaning complete!")
-        print(f"   - Dataset shape: {clean_data.shape}")
+        print(f"   - Dataset shape: {(len(data), len(clean_columns))}")
         print(f"   - Files saved to: {OUTPUT_DIR}")
         print()
 
@@ -103,13 +130,13 @@ def main():
         print("-" * 50)
 
         # Initialize analyzer
-        analyzer = MedicalInsuranceAnalyzer(clean_data, labeled_data)
+        analyzer = MedicalInsuranceAnalyzer(data)
 
         # Run complete analysis
         analysis_results = analyzer.run_full_analysis()
 
         # Export results
-        analyzer.export_results(os.path.join(OUTPUT_DIR, "analysis_results.json"))
+        analyzer.export_results(paths['results'])
 
         print(f"✅ Statistical analysis complete!")
         print()
@@ -121,7 +148,7 @@ def main():
         print("-" * 50)
 
         # Initialize visualizer
-        visualizer = MedicalInsuranceVisualizer(clean_data, labeled_data)
+        visualizer = MedicalInsuranceVisualizer(data)
 
         # Create all required plots
         figures = visualizer.create_all_required_plots(OUTPUT_DIR)
@@ -135,7 +162,7 @@ def main():
         print("📋 STEP 4: GENERATING SUMMARY REPORT")
         print("-" * 50)
 
-        generate_summary_report(loader, analyzer, OUTPUT_DIR)
+        generate_summary_report(loader, analyzer, paths['summary'])
 
         print("✅ Summary report generated!")
         print()
@@ -146,16 +173,19 @@ def main():
         print("🎉 ANALYSIS PIPELINE COMPLETED SUCCESSFULLY!")
         print("=" * 60)
         print("📁 Generated Files:")
-        print(f"   📄 Cleaned Data: {os.path.join(OUTPUT_DIR, 'medical_insurance_cleaned.csv')}")
-        print(f"   📄 Labeled Data: {os.path.join(OUTPUT_DIR, 'medical_insurance_labeled.csv')}")
-        print(f"   📊 Analysis Results: {os.path.join(OUTPUT_DIR, 'analysis_results.json')}")
-        print(f"   📈 Line Chart: {os.path.join(OUTPUT_DIR, 'line_chart_age_vs_charges.png')}")
-        print(f"   📊 Bar Chart: {os.path.join(OUTPUT_DIR, 'bar_chart_region_charges.png')}")
-        print(f"   📊 Histogram: {os.path.join(OUTPUT_DIR, 'histogram_bmi_distribution.png')}")
-        print(f"   📊 Scatter Plot: {os.path.join(OUTPUT_DIR, 'scatter_plot_bmi_vs_charges.png')}")
-        print(f"   🔥 Correlation Heatmap: {os.path.join(OUTPUT_DIR, 'correlation_heatmap.png')}")
-        print(f"   📦 Box Plots: {os.path.join(OUTPUT_DIR, 'box_plots_categorical.png')}")
-        print(f"   📋 Summary Report: {os.path.join(OUTPUT_DIR, 'analysis_summary.txt')}")
+        print(f"   📄 Cleaned Data: {paths['cleaned']}")
+        print(f"   📄 Labeled Data: {paths['labeled']}")
+        if WRITE_PARQUET:
+            print(f"   📄 Cleaned Data (Parquet): {paths['cleaned_parquet']}")
+            print(f"   📄 Labeled Data (Parquet): {paths['labeled_parquet']}")
+        print(f"   📊 Analysis Results: {paths['results']}")
+        print(f"   📈 Line Chart: {paths['line_chart']}")
+        print(f"   📊 Bar Chart: {paths['bar_chart']}")
+        print(f"   📊 Histogram: {paths['histogram']}")
+        print(f"   📊 Scatter Plot: {paths['scatter_plot']}")
+        print(f"   🔥 Correlation Heatmap: {paths['correlation_heatmap']}")
+        print(f"   📦 Box Plots: {paths['box_plots']}")
+        print(f"   📋 Summary Report: {paths['summary']}")
         print()
         print(f"Analysis completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
@@ -167,14 +197,14 @@ def main():
         traceback.print_exc()
         return False
 
-def generate_summary_report(loader, analyzer, output_dir):
+def generate_summary_report(loader, analyzer, output_path):
     """
     Generate a comprehensive summary report.
 
     Parameters:
     loader (MedicalInsuranceDataLoader): Data loader instance
     analyzer (MedicalInsuranceAnalyzer): Analyzer instance
-    output_dir (str): Output directory path
+    output_path (str or Path): Path to save the report
     """
 
     # Get data summary
@@ -191,7 +221,7 @@ DATASET OVERVIEW
 Shape: {data_summary['shape'][0]:,} rows × {data_summary['shape'][1]} columns
 Columns: {', '.join(data_summary['columns'])}
 Memory Usage: {data_summary['memory_usage_kb']:.1f} KB
-Missing Values: {sum(data_summary['missing_values'].values())}
+Missing Values: {data_summary['missing_values']}
 
 KEY FINDINGS
 ============
@@ -273,8 +303,8 @@ End of Report
 ================================================================================
 """
 
-    # Save report - Using os.path.join for cross-platform compatibility
-    with open(os.path.join(output_dir, "analysis_summary.txt"), 'w') as f:
+    # Save report
+    with open(output_path, 'w') as f:
         f.write(report_content)
 
 if __name__ == "__main__":